@@ -1,6 +1,10 @@
 from enum import Enum
 
-class Sort(Enum):
+class _StrEnum(str, Enum):
+    # members are real strings, so str() and url-encoding need no method call.
+    __str__ = str.__str__
+
+class Sort(_StrEnum):
     BEST_MATCH = "Best Match"
     ALPHABET = "Alphabet"
     POPULARITY = "Popularity"
@@ -8,59 +12,38 @@ class Sort(Enum):
     RECENTLY_ADDED = "Recently Added"
     LATEST_UPDATES = "Latest Updates"
 
-    def __str__(self):
-        return self.value
-
-class Order(Enum):
+class Order(_StrEnum):
     ASCENDING = "Ascending"
     DESCENDING = "Descending"
 
-    def __str__(self):
-        return self.value
-
-class OfficialTranslation(Enum):
+class OfficialTranslation(_StrEnum):
     ANY = "Any"
     TRUE = "True"
     FALSE = "False"
 
-    def __str__(self):
-        return self.value
-
-class AnimeAdaptation(Enum):
+class AnimeAdaptation(_StrEnum):
     ANY = "Any"
     TRUE = "True"
     FALSE = "False"
 
-    def __str__(self):
-        return self.value
-
-class AdultContent(Enum):
+class AdultContent(_StrEnum):
     ANY = "Any"
     TRUE = "True"
     FALSE = "False"
 
-    def __str__(self):
-        return self.value
-
-class SeriesStatus(Enum):
+class SeriesStatus(_StrEnum):
     ONGOING = "Ongoing"
     COMPLETE = "Complete"
     HIATUS = "Hiatus"
     CANCELED = "Canceled"
 
-    def __str__(self):
-        return self.value
-
-class SeriesType(Enum):
+class SeriesType(_StrEnum):
     MANGA = "Manga"
     MANHWA = "Manhwa"
     MANHUA = "Manhua"
     OEL = "OEL"
 
-    def __str__(self):
-        return self.value
-
-class Genre(Enum):
+class Genre(_StrEnum):
     ACTION = "Action"
     ADULT = "Adult"
     ADVENTURE = "Adventure"
@@ -100,9 +83,6 @@ class Genre(Enum):
     YURI = "Yuri"
     OTHER = "Other"
 
-    def __str__(self):
-        return self.value
-
 class HotSeries:
 	WEEKLY = "weekly_views"
 	MONTHLY = "monthly_views"
@@ -21,12 +21,16 @@ from enums import (
 )
 
 from ua_generator import generate
-from typing import List, Dict, Optional, Any
-from bs4 import BeautifulSoup
-import requests, time, random, io, os
-from fpdf import FPDF
-from PIL import Image
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Any, Iterator, Callable, Hashable
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from lolhtml import HTMLRewriter, Element
+from html import unescape
+import requests, time, random, os, threading, atexit
+from requests.adapters import HTTPAdapter
+import img2pdf
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from collections import OrderedDict
 
 
 class NetworkError(Exception):
@@ -36,13 +40,68 @@ class NetworkError(Exception):
 
 
 class ParsingError(Exception):
-    """Raised when there's an error parsing HTML content, e.g., from BeautifulSoup."""
+    """Raised when there's an error parsing HTML content, e.g., from lexbor."""
 
     pass
 
 
+# one pooled session shared by every Network instance so keep-alive
+# connections are reused across the whole crawl.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+)
+# generating a user agent is slow, so a handful are made up front. requests
+# use the session's one and only retries pick another.
+_USER_AGENTS = [generate().text for _ in range(32)]
+_SESSION.headers.update({"User-Agent": random.choice(_USER_AGENTS)})
+
+# pdf pages are sized from the image's pixels at 96 dpi.
+_PDF_LAYOUT = img2pdf.get_fixed_dpi_layout_fun((96, 96))
+
+# long-lived worker pools. chapters get their own so a chapter waiting on its
+# pages can never starve the pool those pages run on.
+_POOL = ThreadPoolExecutor(max_workers=16)
+_CHAPTER_POOL = ThreadPoolExecutor(max_workers=8)
+atexit.register(_POOL.shutdown)
+atexit.register(_CHAPTER_POOL.shutdown)
+
+
+def _next_siblings(node: LexborNode, tag: str) -> Iterator[LexborNode]:
+    """Yields the siblings following a node that match the given tag."""
+    sibling = node.next
+    while sibling is not None:
+        if sibling.tag == tag:
+            yield sibling
+        sibling = sibling.next
+
+
+def _first_descendant(node: LexborNode, selector: str) -> Optional[LexborNode]:
+    """Returns the first descendant matching the selector, never the node itself."""
+    return next((match for match in node.css(selector) if match != node), None)
+
+
+class _AttributeCollector:
+    """A lol-html element handler that collects one attribute from every match."""
+
+    def __init__(self, attribute: str) -> None:
+        """Initializes the collector.
+
+        Args:
+                attribute: The name of the attribute to collect.
+        """
+        self.attribute = attribute
+        self.values: List[Optional[str]] = []
+
+    def element(self, element: Element) -> None:
+        """Stores the attribute of a matched element, entity-decoded."""
+        # lol-html hands attribute values over raw, entities included.
+        value = element.get_attribute(self.attribute)
+        self.values.append(unescape(value) if value else value)
+
+
 class Cache:
-    """A simple in-memory key-value cache with a maximum size limit."""
+    """A simple thread-safe, in-memory LRU key-value cache with a maximum size limit."""
 
     def __init__(self, max_size: int = 100):
         """Initializes the cache.
@@ -50,11 +109,12 @@ class Cache:
         Args:
                 max_size (int): The maximum number of items to store in the cache.
         """
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
         self.max_size = max_size
 
-    def get(self, key: str) -> Optional[Any]:
-        """Retrieves an item from the cache.
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retrieves an item from the cache and marks it as recently used.
 
         Args:
                 key: The key of the item to retrieve.
@@ -62,34 +122,76 @@ class Cache:
         Returns:
                 The cached value, or None if the key is not found.
         """
-        return self._cache.get(key)
+        with self._lock:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """Adds or updates an item in the cache.
 
-        If the cache is full, the oldest item is removed.
+        If the cache is full, the least recently used item is removed.
 
         Args:
                 key: The key of the item to store.
                 value: The value to be stored.
         """
-        if len(self._cache) >= self.max_size:
-            self._cache.popitem()
-        self._cache[key] = value
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
 
 
 class Network:
     """Handles network requests using a persistent session and parses HTML content."""
 
     MAX_RETRIES = 3
-    TIMEOUT = 60  # seconds
+    TIMEOUT = 60  # seconds, per attempt
+    TOTAL_TIMEOUT = 150  # seconds, for all attempts of one call
     BASE_URL = "https://weebcentral.com"
+    session = _SESSION
+
+    def _retry(self, url: str, request: Callable[[Optional[dict], float], Any]) -> Any:
+        """Runs a request, retrying it on failure.
 
-    def __init__(self) -> None:
-        """Initializes a requests.Session for making persistent HTTP requests."""
-        self.session = requests.Session()
+        Retries back off exponentially with jitter. Each attempt's timeout is
+        capped at whatever is left of TOTAL_TIMEOUT, and no retry is started once
+        that budget is spent, so a timed-out attempt still leaves room to retry.
 
-    def get_response(self, url: str, params: dict = {}) -> requests.Response:
+        Args:
+                        url: The target URL, used in the error message.
+                        request: Called with the headers to override (or None) and the
+                                timeout for each attempt.
+
+        Returns:
+                        Whatever `request` returns.
+
+        Raises:
+                        NetworkError: If the request fails after all retries.
+        """
+        deadline = time.monotonic() + self.TOTAL_TIMEOUT
+        headers = None
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                timeout = min(self.TIMEOUT, max(0.1, deadline - time.monotonic()))
+                return request(headers, timeout)
+            except requests.exceptions.RequestException as e:
+                # probably 429..
+                # back off a bit more each time and come back as someone else
+                delay = 0.25 * 2**attempt + random.random() * 0.25
+                if (
+                    attempt == self.MAX_RETRIES - 1
+                    or time.monotonic() + delay >= deadline
+                ):
+                    raise NetworkError(f"Failed to get response from {url} due to {e}")
+                headers = {"User-Agent": random.choice(_USER_AGENTS)}
+                time.sleep(delay)
+
+    def get_response(
+        self, url: str, params: Optional[dict] = None
+    ) -> requests.Response:
         """Fetches a URL with retries on failure.
 
         Args:
@@ -102,64 +204,135 @@ class Network:
         Raises:
                         NetworkError: If the request fails after all retries.
         """
-        headers = {"User-Agent": generate().text}
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                if params:
-                    response = self.session.get(
-                        url, params=params, headers=headers, timeout=self.TIMEOUT
-                    )
-                else:
-                    response = self.session.get(
-                        url, headers=headers, timeout=self.TIMEOUT
-                    )
+
+        def request(headers: Optional[dict], timeout: float) -> requests.Response:
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=timeout
+            )
+            response.raise_for_status()
+            return response
+
+        return self._retry(url, request)
+
+    def save_response(self, url: str, path: str) -> None:
+        """Streams a URL's body into a file with retries on failure.
+
+        The body is written to `<path>.part` and only moved to `path` once it is
+        complete, so an interrupted download never looks like a finished one.
+        Errors while reading the body are retried like any other request error.
+
+        Args:
+                        url: The target URL to request.
+                        path: The file path to save the body to.
+
+        Raises:
+                        NetworkError: If the download fails after all retries.
+        """
+        part_path = f"{path}.part"
+
+        def request(headers: Optional[dict], timeout: float) -> None:
+            with self.session.get(
+                url, headers=headers, stream=True, timeout=timeout
+            ) as response:
                 response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                if attempt == self.MAX_RETRIES - 1:
-                    raise NetworkError(f"Failed to get response from {url} due to {e}")
-                # probably 429..
-                # give some delay
-                time.sleep(random.uniform(0.5, 1))
+                with open(part_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        file.write(chunk)
+
+        self._retry(url, request)
+        os.replace(part_path, path)
 
-    def create_soup(self, url: str, params: dict = {}) -> BeautifulSoup:
-        """Fetches a webpage and parses it into a BeautifulSoup object.
+    def create_soup(self, url: str, params: Optional[dict] = None) -> LexborHTMLParser:
+        """Fetches a webpage and parses it into a LexborHTMLParser tree.
 
         Args:
                         url: The target URL to scrape.
                         params: Optional dictionary of query parameters.
 
         Returns:
-                        A BeautifulSoup object of the page's HTML content.
+                        A LexborHTMLParser tree of the page's HTML content.
 
         Raises:
                         ParsingError: If fetching or parsing the HTML fails.
         """
         try:
             response = self.get_response(url, params)
-            return BeautifulSoup(response.text, "html.parser")
+            return LexborHTMLParser(response.text)
+        except Exception as e:
+            raise ParsingError(f"Failed to parse html from {url} due to: {e}")
+
+    def stream_extract(
+        self, url: str, selector: str, attribute: str, params: Optional[dict] = None
+    ) -> List[Optional[str]]:
+        """Streams a webpage through lol-html and collects one attribute of matching tags.
+
+        The body is fed to the rewriter chunk by chunk as it arrives, so no DOM is
+        ever built. Each retry starts from an empty result.
+
+        Args:
+                        url: The target URL to scrape.
+                        selector: The CSS selector of the tags to collect from.
+                        attribute: The name of the attribute to collect.
+                        params: Optional dictionary of query parameters.
+
+        Returns:
+                        The attribute values in document order.
+
+        Raises:
+                        ParsingError: If fetching or parsing the HTML fails.
+        """
+
+        def request(headers: Optional[dict], timeout: float) -> List[Optional[str]]:
+            collector = _AttributeCollector(attribute)
+            rewriter = HTMLRewriter(lambda chunk: None)
+            rewriter.on(selector, collector)
+            with self.session.get(
+                url, params=params, headers=headers, stream=True, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=8192):
+                    rewriter.write(chunk)
+            rewriter.end()
+            return collector.values
+
+        try:
+            return self._retry(url, request)
         except Exception as e:
             raise ParsingError(f"Failed to parse html from {url} due to: {e}")
 
-    def thread(self, funcs, max_workers: int = 15) -> bool:
-        """Executes a list of functions concurrently using a thread pool.
+    def gather(
+        self, funcs, pool: ThreadPoolExecutor = _POOL
+    ) -> List[Optional[BaseException]]:
+        """Executes a list of functions concurrently and waits for every one of them.
 
         Args:
                         funcs: A list of functions to execute.
-                        max_workers: The maximum number of threads to use.
+                        pool: The long-lived pool to run them on.
+
+        Returns:
+                        The exception raised by each function, or None where it succeeded.
+        """
+        futures = [pool.submit(func) for func in funcs]
+        # wait for all of them, a failure must not leave others running behind us.
+        wait(futures)
+        return [future.exception() for future in futures]
+
+    def thread(self, funcs, pool: ThreadPoolExecutor = _POOL) -> bool:
+        """Executes a list of functions concurrently on a shared thread pool.
+
+        Args:
+                        funcs: A list of functions to execute.
+                        pool: The long-lived pool to run them on.
 
         Returns:
                         True if all functions complete successfully, False otherwise.
         """
-        try:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(func) for func in funcs]
-                for future in as_completed(futures):
-                    future.result()
-            return True
-        except Exception as e:
-            # some error for fetching data might have occured.
-            return False
+        # some error for fetching data might have occured.
+        return not any(self.gather(funcs, pool))
+
+
+# value objects (Manga, Chapter, Page) reach the site through this one instance.
+_NETWORK = Network()
 
 
 class Weeb(Network):
@@ -180,9 +353,9 @@ class Weeb(Network):
         official: OfficialTranslation = OfficialTranslation.ANY,
         anime: AnimeAdaptation = AnimeAdaptation.ANY,
         adult: AdultContent = AdultContent.ANY,
-        status: Optional[List[SeriesStatus]] = [],
-        type: Optional[List[SeriesType]] = [],
-        genre: Optional[List[Genre]] = [],
+        status: Optional[List[SeriesStatus]] = None,
+        type: Optional[List[SeriesType]] = None,
+        genre: Optional[List[Genre]] = None,
     ) -> List[Manga]:
         """Searches for manga on WeebCentral with various filtering options.
 
@@ -202,6 +375,19 @@ class Weeb(Network):
         Returns:
                         A list of Manga objects matching the search criteria.
         """
+        cache_key = (
+            query,
+            sort,
+            order,
+            official,
+            anime,
+            adult,
+            tuple(status or ()),
+            tuple(type or ()),
+            tuple(genre or ()),
+        )
+        if cache := self._cache.get(cache_key):
+            return cache
         search_url = f"{self.BASE_URL}/search/data"
         params = {
             "text": query,
@@ -215,15 +401,12 @@ class Weeb(Network):
             "included_tag": genre,
             "display_mode": "Full Display",
         }
-        cache_key = str(sorted(params.items()))
-        if cache := self._cache.get(cache_key):
-            return cache
-        soup = self.create_soup(search_url, params)
+        tree = self.create_soup(search_url, params)
         results = []
-        for item in soup.find_all("span", class_="tooltip tooltip-bottom"):
-            if a_tag := item.find("a"):
-                title = item.get("data-tip")
-                url = a_tag.get("href")
+        for item in tree.css('span[class="tooltip tooltip-bottom"]'):
+            if a_tag := item.css_first("a"):
+                title = item.attributes.get("data-tip")
+                url = a_tag.attributes.get("href")
                 if title and url:
                     manga = Manga(url, title)
                     results.append(manga)
@@ -240,10 +423,10 @@ class Weeb(Network):
                         A list of Manga objects.
         """
         url = f"{self.BASE_URL}/recently-added/{page}"
-        soup = self.create_soup(url)
+        tree = self.create_soup(url)
         series_list = []
-        for series in soup.find_all("a"):
-            manga = Manga(series.get("href"), series.get_text(strip=True))
+        for series in tree.css("a"):
+            manga = Manga(series.attributes.get("href"), series.text(strip=True))
             series_list.append(manga)
         return series_list
 
@@ -258,22 +441,21 @@ class Weeb(Network):
         """
         data = {}
         url = f"{self.BASE_URL}/latest-updates/{page}"
-        soup = self.create_soup(url)
-        articles = soup.find_all(
-            "article",
-            class_="bg-base-100 hover:bg-base-300 flex items-center gap-4 tooltip tooltip-bottom",
+        tree = self.create_soup(url)
+        articles = tree.css(
+            'article[class="bg-base-100 hover:bg-base-300 flex items-center gap-4 tooltip tooltip-bottom"]'
         )
         for article in articles:
-            manga_name = article.get("data-tip")
-            links = article.find_all("a")
-            manga = Manga(links[0].get("href"), manga_name)
+            manga_name = article.attributes.get("data-tip")
+            links = article.css("a")
+            manga = Manga(links[0].attributes.get("href"), manga_name)
             chapter_index = (
                 links[1]
-                .find("div", class_="flex items-center gap-2 opacity-70")
-                .get_text(strip=True)
+                .css_first('div[class="flex items-center gap-2 opacity-70"]')
+                .text(strip=True)
                 .split()[-1]
             )
-            chapter = Chapter(chapter_index, links[1].get("href"))
+            chapter = Chapter(chapter_index, links[1].attributes.get("href"))
             data[manga] = chapter
         return data
 
@@ -287,10 +469,10 @@ class Weeb(Network):
                         A list of Manga objects.
         """
         url = f"{self.BASE_URL}/hot-series?sort={sort}"
-        soup = self.create_soup(url)
+        tree = self.create_soup(url)
         series_list = []
-        for series in soup.find_all("a"):
-            manga = Manga(series.get("href"), series.get_text(strip=True))
+        for series in tree.css("a"):
+            manga = Manga(series.attributes.get("href"), series.text(strip=True))
             series_list.append(manga)
         return series_list
 
@@ -301,36 +483,40 @@ class Weeb(Network):
                         A dictionary mapping Manga objects to their corresponding hot Chapter object.
         """
         data = {}
-        soup = self.create_soup(f"{self.BASE_URL}/hot-updates")
-        divs = soup.find_all(
-            "div", class_="truncate text-white text-center text-lg z-20 w-[90%]"
+        tree = self.create_soup(f"{self.BASE_URL}/hot-updates")
+        desktop_class = "bg-base-100 hover:bg-base-300 md:relative hidden md:block gap-4 tooltip tooltip-bottom"
+        mobile_class = (
+            "bg-base-100 hover:bg-base-300 flex gap-4 md:hidden tooltip tooltip-bottom"
         )
-        divs = [div.get_text(strip=True) for div in divs]
-        links = soup.find_all(
-            "article",
-            class_="bg-base-100 hover:bg-base-300 md:relative hidden md:block gap-4 tooltip tooltip-bottom",
-        )
-        mlinks = soup.find_all(
-            "article",
-            class_="bg-base-100 hover:bg-base-300 flex gap-4 md:hidden tooltip tooltip-bottom",
-        )
-        mlinks = [mlink.a.get("href") for mlink in mlinks]
-        links = [link.a.get("href") for link in links]
+        divs, links, mlinks = [], [], []
+        # a single pass over the document, matches come back in source order.
+        for node in tree.css(
+            'div[class="truncate text-white text-center text-lg z-20 w-[90%]"], '
+            f'article[class="{desktop_class}"], article[class="{mobile_class}"]'
+        ):
+            if node.tag == "div":
+                divs.append(node.text(strip=True))
+            elif node.attributes.get("class") == desktop_class:
+                links.append(node.css_first("a").attributes.get("href"))
+            else:
+                mlinks.append(node.css_first("a").attributes.get("href"))
         for i in range(0, len(divs), 2):
             manga_title = divs[i]
-            manga_url = mlinks[int(i / 2)]
+            manga_url = mlinks[i // 2]
             manga = Manga(manga_url, manga_title)
-            chapter_url = links[int(i / 2)]
-            chapter_index = divs[i + 1].split()
-            if chapter_index[0].startswith("S"):
-                chapter = Chapter(chapter_index[-1], chapter_url, chapter_index[0])
+            chapter_url = links[i // 2]
+            text = divs[i + 1]
+            chapter_index = text.rpartition(" ")[2]
+            if text.startswith("S"):
+                season = int(text.partition(" ")[0][1:])
+                chapter = Chapter(chapter_index, chapter_url, season)
             else:
-                chapter = Chapter(chapter_index[-1], chapter_url)
+                chapter = Chapter(chapter_index, chapter_url)
             data[manga] = chapter
         return data
 
 
-class Manga(Network):
+class Manga:
     """Represents a single manga series, providing methods to fetch its details and chapters.
 
     Attributes:
@@ -342,6 +528,7 @@ class Manga(Network):
                     aliases (List[str]): A list of alternative titles for the manga.
     """
 
+    __slots__ = ("url", "title", "details", "description", "related_series", "aliases")
     _cache = Cache()
 
     def __init__(self, url: str, title: str) -> None:
@@ -351,7 +538,6 @@ class Manga(Network):
                         url: The URL of the manga's main page on WeebCentral.
                         title: The title of the manga.
         """
-        super().__init__()
         self.url = url
         self.title = title
         self.details: dict = {}
@@ -377,26 +563,31 @@ class Manga(Network):
         manga_url.pop()
         manga_url.append("full-chapter-list")
         url = "/".join(manga_url)
-        soup = self.create_soup(url)
-        chapters_target = soup.find_all("span", class_="grow flex items-center gap-2")
-        chapters_target.reverse()
-        links_target = soup.find_all("div", class_="flex items-center")
-        links_target.reverse()
+        tree = _NETWORK.create_soup(url)
+        chapters_target, links_target = [], []
+        # a single pass over the document, matches come back in source order.
+        for node in tree.css(
+            'span[class="grow flex items-center gap-2"], div[class="flex items-center"]'
+        ):
+            if node.tag == "span":
+                chapters_target.append(_first_descendant(node, "span").text(strip=True))
+            else:
+                links_target.append(node.css_first("a").attributes.get("href"))
 
         count = 0
         season = 1
-        for chapter, link in zip(chapters_target, links_target):
-            chapter = chapter.span.get_text(strip=True).split()
-            link = link.a.get("href")
-            if chapter[0].startswith("S"):
+        # the list is newest first.
+        for text, link in zip(reversed(chapters_target), reversed(links_target)):
+            chapter_index = text.rpartition(" ")[2]
+            if text.startswith("S"):
                 # has a season.
-                chapter = Chapter(chapter[-1], link, int(chapter[0][1:]))
+                chapter = Chapter(chapter_index, link, int(text.partition(" ")[0][1:]))
             else:
                 count += 1
                 if count == 100:
                     count = 0
                     season += 1
-                chapter = Chapter(chapter[-1], link, season)
+                chapter = Chapter(chapter_index, link, season)
             data.append(chapter)
         # save for next time if needed
         self._cache.set(self.url, data)
@@ -418,30 +609,41 @@ class Manga(Network):
         """
         if season:
             chapters = [chapter for chapter in chapters if chapter.season == season]
-        max = float(chapters[-1].index)
-        end = end if end else max
-        if max < end or start < 1:
+        indexes = [float(chapter.index) for chapter in chapters]
+        if not indexes:
             return []
-
-        def in_between(n):
-            index = float(n.index)
-            return index <= end and index >= start
-
-        chapters = filter(in_between, chapters)
-        return chapters
+        last = indexes[-1]
+        end = end if end else last
+        if last < end or start < 1:
+            return []
+        return [
+            chapter
+            for chapter, index in zip(chapters, indexes)
+            if start <= index <= end
+        ]
 
     def download(self, chapters: List[Chapter]) -> None:
-        """Downloads a given list of chapters for the manga.
+        """Downloads a given list of chapters for the manga concurrently.
 
         Creates a directory named after the manga title and saves each chapter within it.
 
         Args:
                         chapters: A list of Chapter objects to download.
+
+        Raises:
+                        NetworkError: If any chapter fails to download, once all of them are done.
         """
         path = "-".join(self.title.split())
         os.makedirs(path, exist_ok=True)
-        for chapter in chapters:
-            chapter.download(path)
+        funcs = [partial(chapter.download, path) for chapter in chapters]
+        # a few chapters at a time; each one fans out over its own pages.
+        errors = _NETWORK.gather(funcs, _CHAPTER_POOL)
+        failed = [(chapter, error) for chapter, error in zip(chapters, errors) if error]
+        if failed:
+            indexes = ", ".join(str(chapter.index) for chapter, _ in failed)
+            raise NetworkError(
+                f"Failed to download chapters {indexes} of {self.title}"
+            ) from failed[0][1]
 
     def get_details(self) -> None:
         """Scrapes the manga's page to populate its metadata attributes.
@@ -449,45 +651,48 @@ class Manga(Network):
         This includes details like author, artist, genres, description,
         aliases, and related series.
         """
-        soup = self.create_soup(self.url)
-        uls = soup.find_all("ul", class_="flex flex-col gap-4")
+        tree = _NETWORK.create_soup(self.url)
+        uls = tree.css('ul[class="flex flex-col gap-4"]')
         about = uls[0]
-        strongs = about.find_all("strong")
+        strongs = about.css("strong")
         for strong in strongs:
-            if strong.get_text(strip=True).startswith("RSS") or strong.get_text(
+            if strong.text(strip=True).startswith("RSS") or strong.text(
                 strip=True
             ).startswith("Track"):
                 continue
-            a = strong.find_next_sibling("a")
+            a = next(_next_siblings(strong, "a"), None)
             if a is not None:
-                self.details[strong.get_text(strip=True)] = a.get_text(strip=True)
+                self.details[strong.text(strip=True)] = a.text(strip=True)
             else:
-                spans = strong.find_next_siblings("span")
+                spans = _next_siblings(strong, "span")
                 to_print = []
                 for span in spans:
-                    if span.a is not None:
-                        to_print.append(span.a.get_text(strip=True))
+                    if (span_a := span.css_first("a")) is not None:
+                        to_print.append(span_a.text(strip=True))
                     else:
-                        to_print.append(span.get_text(strip=True))
-                self.details[strong.get_text(strip=True)] = ", ".join(to_print)
+                        to_print.append(span.text(strip=True))
+                self.details[strong.text(strip=True)] = ", ".join(to_print)
         desc = uls[1]
-        strongs = desc.find_all("strong")
-        self.description = desc.p.get_text(strip=True)
+        strongs = desc.css("strong")
+        self.description = desc.css_first("p").text(strip=True)
         try:
-            text = strongs[1].get_text(strip=True)
+            text = strongs[1].text(strip=True)
         except:
             return
-        names = [name for name in desc.ul.find_all("li")]
+        names = _first_descendant(desc, "ul").css("li")
         if text.startswith("Related"):
             for name in names:
                 self.related_series.append(
-                    Manga(name.a.get("href"), name.get_text(strip=True))
+                    Manga(
+                        name.css_first("a").attributes.get("href"),
+                        name.text(strip=True),
+                    )
                 )
             return
-        self.aliases = [name.get_text(strip=True) for name in names]
+        self.aliases = [name.text(strip=True) for name in names]
 
 
-class Chapter(Network):
+class Chapter:
     """Represents a single chapter of a manga.
 
     Attributes:
@@ -496,6 +701,7 @@ class Chapter(Network):
                     season (int): The season number the chapter belongs to, if applicable.
     """
 
+    __slots__ = ("index", "url", "season")
     _cache = Cache()
 
     def __init__(self, index: str, url: str, season: int = 0):
@@ -506,7 +712,6 @@ class Chapter(Network):
                         url: The URL to the chapter's reader page.
                         season: The season number, if the manga is divided into seasons. Defaults to 0.
         """
-        super().__init__()
         self.index = index
         self.url = url
         self.season = season
@@ -523,11 +728,9 @@ class Chapter(Network):
             return cache
         pages_url = self.url + "/images"
         params = {"is_prev": "False", "reading_style": "long_strip"}
-        soup = self.create_soup(pages_url, params)
-        images = soup.find_all("img")
+        urls = _NETWORK.stream_extract(pages_url, "img", "src", params)
         pages = []
-        for index, image in enumerate(images, start=1):
-            url = image.get("src")
+        for index, url in enumerate(urls, start=1):
             page = Page(index, url)
             pages.append(page)
 
@@ -535,15 +738,32 @@ class Chapter(Network):
         self._cache.set(self.url, pages)
         return pages
 
-    def download_pages(self) -> List[Page]:
+    def download_pages(self, folder_path: Optional[str] = None) -> List[Page]:
         """Downloads the image data for all pages in the chapter concurrently.
 
+        Args:
+                        folder_path: If given, each page is streamed into `<index>.png` inside
+                                it instead of being kept in memory. Existing files are skipped.
+
         Returns:
-                        A list of Page objects with their `data` attribute populated.
+                        A list of Page objects with their `data` attribute populated
+                        (left empty when streamed to `folder_path`).
                         Returns an empty list on failure.
         """
         pages = self.get_pages()
-        success = self.thread([page.fetch_data for page in pages])
+        if folder_path is None:
+            funcs = [page.fetch_data for page in pages]
+        else:
+            # one directory scan instead of a stat per page.
+            existing = {entry.name for entry in os.scandir(folder_path)}
+            funcs = []
+            for page in pages:
+                file_name = f"{page.index}.png"
+                if file_name in existing:
+                    continue
+                file_path = os.path.join(folder_path, file_name)
+                funcs.append(partial(page.fetch_data, file_path))
+        success = _NETWORK.thread(funcs)
         if not success:
             return []
         # sort pages just in case
@@ -566,25 +786,20 @@ class Chapter(Network):
             print(f"{file_name} exists.")
             return
         print(f"Downloading Chapter: {index}", end="\r")
-        pages = self.download_pages()
-        assert pages  # will throw AssertionError if list is empty
         match download_type:
             case DownloadType.IMAGE:
-                # handles image type
-                folder_path = os.path.join(path, self.index)
-                os.makedirs(self.index, exist_ok=True)
-                for page in pages:
-                    file_name = f"{page.index}.png"
-                    file_path = os.path.join(folder_path, file_name)
-                    if os.path.exists(file_path):
-                        continue
-                    with open(file_path, "wb") as file:
-                        file.write(page.data)
+                # handles image type, pages go straight to disk
+                folder_path = os.path.join(path, str(self.index))
+                os.makedirs(folder_path, exist_ok=True)
+                pages = self.download_pages(folder_path)
+                assert pages  # will throw AssertionError if list is empty
                 print(
                     f"Chapter {index}'s pages have been downloaded and stored in {folder_path}"
                 )
 
             case DownloadType.PDF:
+                pages = self.download_pages()
+                assert pages  # will throw AssertionError if list is empty
                 self.create_pdf(file_path, pages)
 
     def create_pdf(self, path: str, pages: List[Page]) -> None:
@@ -594,25 +809,26 @@ class Chapter(Network):
                         path: The full file path (including filename) to save the PDF.
                         pages: A list of Page objects with their image data already fetched.
         """
-        pdf = FPDF(unit="mm")
-        pdf.set_compression(False)
-        pdf.set_margins(0, 0)
-        pdf.set_auto_page_break(False)
-
-        for page in pages:
-            img_bytes = page.data
-            assert img_bytes
-            with Image.open(io.BytesIO(img_bytes)) as img:
-                width_mm = img.width * 25.4 / 96
-                height_mm = img.height * 25.4 / 96
-
-            pdf.add_page(format=(width_mm, height_mm))
-            pdf.image(io.BytesIO(img_bytes), x=0, y=0, w=width_mm, h=height_mm)
-        pdf.output(path)
+        # images are embedded as-is, JPEG streams are never re-encoded.
+        # only a complete pdf ever gets the final name, a broken one would be
+        # mistaken for a finished chapter on the next run.
+        part_path = f"{path}.part"
+        try:
+            with open(part_path, "wb") as file:
+                img2pdf.convert(
+                    [page.data for page in pages],
+                    layout_fun=_PDF_LAYOUT,
+                    outputstream=file,
+                )
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        os.replace(part_path, path)
         print(f"Chapter {self.index} has been downloaded as {path}")
 
 
-class Page(Network):
+class Page:
     """Represents a single page of a manga chapter.
 
     Attributes:
@@ -621,6 +837,7 @@ class Page(Network):
                     data (bytes): The raw image data, populated after calling fetch_data().
     """
 
+    __slots__ = ("index", "url", "data")
     _cache = Cache()
 
     def __init__(self, index: int, url: str) -> None:
@@ -630,19 +847,32 @@ class Page(Network):
                         index: The page number.
                         url: The direct URL of the page's image.
         """
-        super().__init__()
         self.index = index
         self.url = url
         # not initiated in constructor cause we don't wanna overload unless need it.
         self.data: bytes = b""
 
-    def fetch_data(self) -> None:
+    def fetch_data(self, sink_path: Optional[str] = None) -> None:
         """Fetches the raw image data for this page and stores it in the `data` attribute.
 
-        Image data is cached to prevent re-downloads.
+        Image data is cached to prevent re-downloads. If `sink_path` is given, the
+        image is streamed into that file instead and no copy is kept in memory.
+
+        Args:
+                        sink_path: Optional file path to stream the image into.
         """
-        if cache := self._cache.get(self.url):
-            self.data = cache
+        cache = self._cache.get(self.url)
+        if sink_path is None:
+            if cache:
+                self.data = cache
+                return
+            self.data = _NETWORK.get_response(self.url).content
+            self._cache.set(self.url, self.data)
+            return
+        if cache:
+            part_path = f"{sink_path}.part"
+            with open(part_path, "wb") as file:
+                file.write(cache)
+            os.replace(part_path, sink_path)
             return
-        self.data = self.get_response(self.url).content
-        self._cache.set(self.url, self.data)
+        _NETWORK.save_response(self.url, sink_path)